@@ -1,66 +1,381 @@
-from flask import Flask, request, jsonify, render_template
-from datetime import datetime
-import re
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import DefaultJSONProvider
+from array import array
+from datetime import datetime, timedelta
+import json
 import os
+import random
+import re
+import sys
+import string
+import time
+import msgpack
+import orjson
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Item codes shared by the vectorized path and the scan kernel
+CODE_NUMBER, CODE_ALPHABET, CODE_SPECIAL = 0, 1, 2
+
+def _scan_items(codes, values):
+    """
+    Sum the numeric items and flag which of them are even or odd
+    """
+    n = codes.shape[0]
+    even_mask = np.zeros(n, dtype=np.bool_)
+    odd_mask = np.zeros(n, dtype=np.bool_)
+    total = 0
+    for i in range(n):
+        if codes[i] == CODE_NUMBER:
+            value = values[i]
+            total += value
+            if value & 1:
+                odd_mask[i] = True
+            else:
+                even_mask[i] = True
+    return total, even_mask, odd_mask
+
+def _scan_items_numpy(codes, values):
+    """
+    Mask-based equivalent of _scan_items for when Numba is not installed
+    """
+    num_mask = codes == CODE_NUMBER
+    odd_bits = (values & 1).astype(bool)
+    return values[num_mask].sum(), num_mask & ~odd_bits, num_mask & odd_bits
+
+# Prefer the AOT-built kernel (see process_array_aot.py), then the JIT one
+try:
+    from process_array_mod import scan as scan_items
+except ImportError:
+    if numba is not None:
+        scan_items = numba.njit(cache=True)(_scan_items)
+    else:
+        scan_items = _scan_items_numpy
+
+# Shared generator for bulk test data generation
+_rng = np.random.default_rng() if np is not None else None
+
+# Special characters used by the test data generator
+_SPECIAL_CHARS = ('@', '#', '$', '%', '&', '*', '-', '+', '=', '!', '?', '^', '~')
+_PATTERN_SPECIAL_CHARS = ('@', '#', '$', '%', '&')
+_SPECIAL_CHAR_ARRAY = np.array(_SPECIAL_CHARS) if np is not None else None
+
+# Arrays shorter than this are cheaper to classify with the plain loop
+VECTORIZE_THRESHOLD = 256
+
+# NumPy pads every item to the longest one, so longer items stay on the plain loop
+VECTORIZE_MAX_ITEM_LENGTH = 32
+
+def _class_for(byte):
+    """
+    Map a byte to its class: digit '0', letter 'a', sign/dot as-is, other '?'
+    """
+    char = chr(byte)
+    if '0' <= char <= '9':
+        return ord('0')
+    if 'a' <= char <= 'z' or 'A' <= char <= 'Z':
+        return ord('a')
+    if char in '-.':
+        return byte
+    return ord('?')
+
+# Translation table that turns an item's bytes into its class bytes
+_CLASS_TABLE = bytes.maketrans(bytes(range(256)), bytes(_class_for(c) for c in range(256)))
+
+# ASCII case tables used to build the alternating caps string
+_UPPER_TABLE = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+_LOWER_TABLE = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that routes Flask's JSON handling through orjson
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Integer literals this long may not fit in 64 bits, which orjson parses as floats
+_LONG_INT_PATTERN = re.compile(rb'\d{19}')
+
+def loads_json_body(raw_bytes):
+    """
+    Parse a JSON request body, keeping integers beyond 64 bits exact
+    """
+    # orjson also validates, so callers only ever see orjson.JSONDecodeError
+    request_data = orjson.loads(raw_bytes)
+    # Only bodies with a long digit run need the slower, exact stdlib parser
+    if _LONG_INT_PATTERN.search(raw_bytes):
+        return json.loads(raw_bytes)
+    return request_data
+
+def extract_data_field(raw_bytes):
+    """
+    Extract the 'data' field from a raw JSON request body
+    Raises KeyError when the body has no top-level 'data' key
+    """
+    # Scan the raw bytes first so bodies without a 'data' key are never parsed;
+    # a key spelled with escapes (e.g. "\u0064ata") needs a backslash, so those bodies are parsed
+    if b'"data"' not in raw_bytes and b'\\' not in raw_bytes:
+        raise KeyError('data')
+    
+    request_data = loads_json_body(raw_bytes)
+    if not isinstance(request_data, dict) or 'data' not in request_data:
+        raise KeyError('data')
+    
+    return request_data['data']
+
+def apply_alternating_caps(reversed_bytes):
+    """
+    Apply alternating caps in place to a reversed bytearray of letters
+    """
+    # Upper-case even positions and lower-case odd ones in two C-level passes
+    reversed_bytes[0::2] = reversed_bytes[0::2].translate(_UPPER_TABLE)
+    reversed_bytes[1::2] = reversed_bytes[1::2].translate(_LOWER_TABLE)
+    return reversed_bytes.decode('ascii')
+
+def append_number(values, num):
+    """
+    Append num to an int64 buffer, switching to a list if it does not fit
+    """
+    try:
+        values.append(num)
+    except OverflowError:
+        values = list(values)
+        values.append(num)
+    return values
+
+def uppercase_all(alphabet_strings):
+    """
+    Upper-case a list of ASCII letter strings with a single translate call
+    """
+    if not alphabet_strings:
+        return []
+    # NUL never appears in alphabet items, so it is a safe separator
+    joined = '\x00'.join(alphabet_strings).encode('ascii')
+    return joined.translate(_UPPER_TABLE).decode('ascii').split('\x00')
+
+def build_concat_string(alphabet_strings):
+    """
+    Join alphabet strings, reverse them and apply alternating caps
+    """
+    # Alphabet strings are ASCII letters only, so work on bytes
+    concat_bytes = bytearray(''.join(alphabet_strings).encode('ascii'))
+    concat_bytes.reverse()
+    return apply_alternating_caps(concat_bytes)
+
+def process_array_vectorized(item_strs):
+    """
+    Classify all items at once with NumPy boolean masks
+    Returns None when the input needs the exact per-item loop
+    """
+    # One long item would make the fixed-width array (and its copies) len(item_strs) times its size
+    if max(map(len, item_strs)) > VECTORIZE_MAX_ITEM_LENGTH:
+        return None
+    
+    joined = ''.join(item_strs)
+    # NumPy drops trailing NULs and its isalpha is Unicode-aware
+    if not joined.isascii() or '\x00' in joined:
+        return None
+    
+    arr = np.asarray(item_strs, dtype=str)
+    cleaned = np.char.replace(np.char.replace(arr, '-', ''), '.', '')
+    num_mask = np.char.isdigit(cleaned)
+    alpha_mask = ~num_mask & np.char.isalpha(arr)
+    special_mask = ~(num_mask | alpha_mask)
+    
+    num_strs = arr[num_mask]
+    # Anything wider than 18 characters may not fit in an int64
+    if num_strs.size and np.char.str_len(num_strs).max() > 18:
+        return None
+    
+    codes = np.full(arr.shape[0], CODE_SPECIAL, dtype=np.int8)
+    codes[num_mask] = CODE_NUMBER
+    codes[alpha_mask] = CODE_ALPHABET
+    values = np.zeros(arr.shape[0], dtype=np.int64)
+    # Integers parse directly; only decimals go through float
+    dotted = np.char.count(num_strs, '.') > 0
+    num_values = np.empty(num_strs.shape[0], dtype=np.int64)
+    num_values[~dotted] = num_strs[~dotted].astype(np.int64)
+    num_values[dotted] = num_strs[dotted].astype(np.float64).astype(np.int64)
+    values[num_mask] = num_values
+    
+    numbers_sum, even_mask, odd_mask = scan_items(codes, values)
+    # Fall back to Python ints if the int64 accumulator could have wrapped
+    nums = values[num_mask]
+    if nums.size and int(np.abs(nums).max()) * nums.size >= 2 ** 63:
+        numbers_sum = sum(nums.tolist())
+    
+    alphabet_strings = arr[alpha_mask].tolist()
+    
+    return {
+        "odd_numbers": values[odd_mask].astype(str).tolist(),
+        "even_numbers": values[even_mask].astype(str).tolist(),
+        "alphabets": uppercase_all(alphabet_strings),
+        "special_characters": arr[special_mask].tolist(),
+        "sum": int(numbers_sum),
+        "concat_string": build_concat_string(alphabet_strings)
+    }
 
 def process_array(data_array):
     """
     Process the input array and return the required output
     """
     try:
-        odd_numbers = []
-        even_numbers = []
-        alphabets = []
+        item_strs = [str(item) for item in data_array]
+        
+        # Large inputs go through the vectorized path when NumPy is available
+        if np is not None and len(item_strs) >= VECTORIZE_THRESHOLD:
+            processed = process_array_vectorized(item_strs)
+            if processed is not None:
+                return processed
+        
+        # Packed int64 buffers, stringified only when building the response
+        odd_values = array('q')
+        even_values = array('q')
+        alphabet_strings = []
         special_characters = []
         numbers_sum = 0
-        alphabet_strings = []
+        # Letters of every alphabet item, reversed in place after the loop
+        concat_bytes = bytearray()
         
-        for item in data_array:
-            item_str = str(item)
+        for item_str in item_strs:
+            if item_str.isascii():
+                item_bytes = item_str.encode('ascii')
+                classes = item_bytes.translate(_CLASS_TABLE)
+                is_number = b'0' in classes and not classes.strip(b'0-.')
+            else:
+                # Unicode digits (e.g. '٣') are numbers, as str.isdigit and float accept them;
+                # any other non-ASCII item is a special character
+                item_bytes = classes = b'?'
+                is_number = item_str.replace('-', '').replace('.', '').isdigit()
             
-            # Check if it's a number
-            if item_str.replace('-', '').replace('.', '').isdigit():
-                num = int(float(item_str))
-                if num % 2 == 0:
-                    even_numbers.append(str(num))
+            # Check if it's a number (digits with optional signs and dots)
+            if is_number:
+                # Integers parse directly; only decimals go through float
+                num = int(float(item_str)) if '.' in item_str else int(item_str)
+                if num & 1:
+                    odd_values = append_number(odd_values, num)
                 else:
-                    odd_numbers.append(str(num))
+                    even_values = append_number(even_values, num)
                 numbers_sum += num
             # Check if it's an alphabet (single character or word)
-            elif re.match(r'^[a-zA-Z]+$', item_str):
-                alphabets.append(item_str.upper())
+            elif classes.isalpha():
                 alphabet_strings.append(item_str)
+                concat_bytes += item_bytes
             # Check if it's a special character
             else:
                 special_characters.append(item_str)
         
-        # Create concatenated string with alternating caps in reverse order
-        concat_string = ""
-        if alphabet_strings:
-            # Join all alphabet strings and reverse
-            all_chars = ''.join(alphabet_strings)
-            reversed_chars = all_chars[::-1]
-            
-            # Apply alternating caps
-            for i, char in enumerate(reversed_chars):
-                if i % 2 == 0:
-                    concat_string += char.upper()
-                else:
-                    concat_string += char.lower()
+        concat_bytes.reverse()
         
         return {
-            "odd_numbers": odd_numbers,
-            "even_numbers": even_numbers,
-            "alphabets": alphabets,
+            "odd_numbers": list(map(str, odd_values)),
+            "even_numbers": list(map(str, even_values)),
+            "alphabets": uppercase_all(alphabet_strings),
             "special_characters": special_characters,
-            "sum": str(numbers_sum),
-            "concat_string": concat_string
+            "sum": numbers_sum,
+            "concat_string": apply_alternating_caps(concat_bytes)
         }
     except Exception as e:
         raise Exception(f"Error processing array: {str(e)}")
 
+def generate_numbers(count, low, high):
+    """
+    Generate count random integers in [low, high] as strings
+    """
+    if _rng is None:
+        return [str(random.randint(low, high)) for _ in range(count)]
+    return _rng.integers(low, high, size=count, endpoint=True).astype(str).tolist()
+
+def generate_words(count, min_length, max_length):
+    """
+    Generate count random words with lengths in [min_length, max_length]
+    """
+    if _rng is None:
+        return [
+            ''.join(random.choices(string.ascii_letters, k=random.randint(min_length, max_length)))
+            for _ in range(count)
+        ]
+    
+    # Draw every length and every letter in one call each, then slice
+    lengths = np.maximum(_rng.integers(min_length, max_length, size=count, endpoint=True), 0)
+    ends = np.cumsum(lengths).tolist()
+    letter_codes = np.frombuffer(string.ascii_letters.encode(), dtype=np.uint8)
+    letters = letter_codes[_rng.integers(0, len(letter_codes), size=ends[-1] if ends else 0)]
+    joined = letters.tobytes().decode('ascii')
+    
+    starts = [0] + ends[:-1]
+    return [joined[start:end] for start, end in zip(starts, ends)]
+
+def generate_specials(count):
+    """
+    Pick count random special characters
+    """
+    if _rng is None:
+        return [random.choice(_SPECIAL_CHARS) for _ in range(count)]
+    return _SPECIAL_CHAR_ARRAY[_rng.integers(0, len(_SPECIAL_CHARS), size=count)].tolist()
+
+# Cached (expires_at, user_id) pair, refreshed at local midnight
+_user_id_cache = (0.0, "")
+
+def current_user_id():
+    """
+    Return today's user_id, formatting the date only once per day
+    """
+    global _user_id_cache
+    now = time.time()
+    expires_at, user_id = _user_id_cache
+    
+    if now >= expires_at:
+        today = datetime.fromtimestamp(now)
+        next_midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+        user_id = f"john_doe_{today.strftime('%d%m%Y')}"
+        _user_id_cache = (next_midnight.timestamp(), user_id)
+    
+    return user_id
+
+def build_bfhl_response(data_array):
+    """
+    Process the input array and wrap it in the BFHL response body
+    """
+    processed_data = process_array(data_array)
+    
+    return {
+        "is_success": True,
+        "user_id": current_user_id(),
+        "email": "john@xyz.com",
+        "roll_number": "ABCD123",
+        **processed_data,
+        # The API contract returns the sum as a string
+        "sum": str(processed_data["sum"])
+    }
+
+def msgpack_response(body, status):
+    """
+    Build a msgpack-encoded response with the given status code
+    """
+    return Response(msgpack.packb(body), mimetype='application/msgpack'), status
+
 @app.route('/bfhl', methods=['POST'])
 def bfhl():
     """
@@ -68,15 +383,18 @@ def bfhl():
     """
     try:
         # Get request data
-        request_data = request.get_json()
-        
-        if not request_data or 'data' not in request_data:
+        try:
+            data_array = extract_data_field(request.get_data(cache=False))
+        except KeyError:
             return jsonify({
                 "is_success": False,
                 "error": "Missing 'data' field in request"
             }), 400
-        
-        data_array = request_data['data']
+        except orjson.JSONDecodeError:
+            return jsonify({
+                "is_success": False,
+                "error": "Request body must be valid JSON"
+            }), 400
         
         if not isinstance(data_array, list):
             return jsonify({
@@ -84,20 +402,8 @@ def bfhl():
                 "error": "'data' must be an array"
             }), 400
         
-        # Process the array
-        processed_data = process_array(data_array)
-        
-        # Get current date for user_id
-        current_date = datetime.now().strftime("%d%m%Y")
-        
-        # Create response
-        response = {
-            "is_success": True,
-            "user_id": f"john_doe_{current_date}",
-            "email": "john@xyz.com",
-            "roll_number": "ABCD123",
-            **processed_data
-        }
+        # Process the array and create response
+        response = build_bfhl_response(data_array)
         
         return jsonify(response), 200
         
@@ -107,6 +413,105 @@ def bfhl():
             "error": str(e)
         }), 500
 
+@app.route('/bfhl/bin', methods=['POST'])
+def bfhl_bin():
+    """
+    Binary variant of /bfhl that accepts and returns msgpack
+    """
+    try:
+        try:
+            request_data = msgpack.unpackb(request.get_data(cache=False), raw=False)
+        except ValueError:
+            return msgpack_response({
+                "is_success": False,
+                "error": "Request body must be valid msgpack"
+            }, 400)
+        
+        if not isinstance(request_data, dict) or 'data' not in request_data:
+            return msgpack_response({
+                "is_success": False,
+                "error": "Missing 'data' field in request"
+            }, 400)
+        
+        data_array = request_data['data']
+        
+        if not isinstance(data_array, list):
+            return msgpack_response({
+                "is_success": False,
+                "error": "'data' must be an array"
+            }, 400)
+        
+        return msgpack_response(build_bfhl_response(data_array), 200)
+        
+    except Exception as e:
+        return msgpack_response({
+            "is_success": False,
+            "error": str(e)
+        }, 500)
+
+# Upper bound on the number of sub-requests accepted by /batch
+MAX_BATCH_SIZE = 100
+
+def run_batch_item(item):
+    """
+    Run a single /batch sub-request and return its status code and body
+    """
+    if not isinstance(item, dict):
+        return 400, {"is_success": False, "error": "Batch item must be an object"}
+    
+    if item.get('method', 'POST') != 'POST' or item.get('uri') != '/bfhl':
+        return 404, {"is_success": False, "error": "Only POST /bfhl can be batched"}
+    
+    parameters = item.get('parameters')
+    if not isinstance(parameters, dict) or 'data' not in parameters:
+        return 400, {"is_success": False, "error": "Missing 'data' field in request"}
+    
+    data_array = parameters['data']
+    if not isinstance(data_array, list):
+        return 400, {"is_success": False, "error": "'data' must be an array"}
+    
+    try:
+        return 200, build_bfhl_response(data_array)
+    except Exception as e:
+        return 500, {"is_success": False, "error": str(e)}
+
+@app.route('/batch', methods=['POST'])
+def batch():
+    """
+    Run several /bfhl requests in a single round trip
+    """
+    try:
+        request_data = loads_json_body(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return jsonify({
+            "is_success": False,
+            "error": "Request body must be valid JSON"
+        }), 400
+    
+    items = request_data.get('requests') if isinstance(request_data, dict) else None
+    if not isinstance(items, list):
+        return jsonify({
+            "is_success": False,
+            "error": "'requests' must be an array"
+        }), 400
+    
+    if len(items) > MAX_BATCH_SIZE:
+        return jsonify({
+            "is_success": False,
+            "error": f"A batch can contain at most {MAX_BATCH_SIZE} requests"
+        }), 400
+    
+    results = []
+    for item in items:
+        status, body = run_batch_item(item)
+        results.append({
+            "id": item.get('id') if isinstance(item, dict) else None,
+            "status": status,
+            "body": body
+        })
+    
+    return jsonify({"is_success": True, "results": results}), 200
+
 @app.route('/', methods=['GET'])
 def home():
     """
@@ -114,40 +519,49 @@ def home():
     """
     return render_template('index.html')
 
+# Static payloads, serialized once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "message": "BFHL API is running",
+    "endpoint": "/bfhl",
+    "method": "POST"
+})
+
+_BFHL_INFO_BODY = orjson.dumps({
+    "message": "BFHL API",
+    "usage": "Send POST request with JSON body containing 'data' array",
+    "examples": {
+        "basic": ["a", "1", "334", "4", "R", "$"],
+        "mixed": ["2", "a", "y", "4", "&", "-", "*", "5", "92", "b"],
+        "alphabets_only": ["A", "ABcD", "DOE"],
+        "numbers_only": ["1", "2", "3", "4", "5"],
+        "special_chars": ["@", "#", "$", "%", "&"],
+        "negative_numbers": ["-1", "2", "a", "B", "&"],
+        "empty": []
+    },
+    "endpoint": "/bfhl",
+    "method": "POST",
+    "generate_data": "/bfhl/generate",
+    "method_generate": "GET",
+    "binary_endpoint": "/bfhl/bin",
+    "binary_format": "msgpack",
+    "batch_endpoint": "/batch",
+    "method_batch": "POST"
+})
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
     Health check endpoint
     """
-    return jsonify({
-        "status": "healthy",
-        "message": "BFHL API is running",
-        "endpoint": "/bfhl",
-        "method": "POST"
-    }), 200
+    return Response(_HEALTH_BODY, mimetype='application/json'), 200
 
 @app.route('/bfhl', methods=['GET'])
 def bfhl_info():
     """
     GET endpoint to show API information
     """
-    return jsonify({
-        "message": "BFHL API",
-        "usage": "Send POST request with JSON body containing 'data' array",
-        "examples": {
-            "basic": ["a", "1", "334", "4", "R", "$"],
-            "mixed": ["2", "a", "y", "4", "&", "-", "*", "5", "92", "b"],
-            "alphabets_only": ["A", "ABcD", "DOE"],
-            "numbers_only": ["1", "2", "3", "4", "5"],
-            "special_chars": ["@", "#", "$", "%", "&"],
-            "negative_numbers": ["-1", "2", "a", "B", "&"],
-            "empty": []
-        },
-        "endpoint": "/bfhl",
-        "method": "POST",
-        "generate_data": "/bfhl/generate",
-        "method_generate": "GET"
-    }), 200
+    return Response(_BFHL_INFO_BODY, mimetype='application/json'), 200
 
 @app.route('/bfhl/generate', methods=['GET'])
 def generate_test_data():
@@ -155,34 +569,23 @@ def generate_test_data():
     Generate dynamic test data based on query parameters
     """
     try:
-        import random
-        import string
-        
         # Get query parameters
         data_type = request.args.get('type', 'random')
         count = int(request.args.get('count', 10))
         min_length = int(request.args.get('min_length', 1))
         max_length = int(request.args.get('max_length', 5))
         
-        # Limit count for safety
-        count = min(count, 50)
+        # Limit count for safety; negative counts generate nothing
+        count = max(0, min(count, 50))
         
         generated_data = []
         
         if data_type == 'random':
-            # Generate completely random data
-            for _ in range(count):
-                choice = random.choice(['number', 'alphabet', 'special'])
-                if choice == 'number':
-                    num = random.randint(-100, 100)
-                    generated_data.append(str(num))
-                elif choice == 'alphabet':
-                    length = random.randint(min_length, max_length)
-                    word = ''.join(random.choices(string.ascii_letters, k=length))
-                    generated_data.append(word)
-                else:
-                    special_chars = ['@', '#', '$', '%', '&', '*', '-', '+', '=', '!', '?', '^', '~']
-                    generated_data.append(random.choice(special_chars))
+            # Generate completely random data, one bulk call per kind
+            choices = random.choices(['number', 'alphabet', 'special'], k=count)
+            generated_data += generate_numbers(choices.count('number'), -100, 100)
+            generated_data += generate_words(choices.count('alphabet'), min_length, max_length)
+            generated_data += generate_specials(choices.count('special'))
                     
         elif data_type == 'mixed':
             # Generate balanced mixed data
@@ -190,40 +593,21 @@ def generate_test_data():
             alpha_count = count // 3
             special_count = count - num_count - alpha_count
             
-            # Numbers
-            for _ in range(num_count):
-                num = random.randint(-50, 50)
-                generated_data.append(str(num))
-            
-            # Alphabets
-            for _ in range(alpha_count):
-                length = random.randint(min_length, max_length)
-                word = ''.join(random.choices(string.ascii_letters, k=length))
-                generated_data.append(word)
-            
-            # Special characters
-            special_chars = ['@', '#', '$', '%', '&', '*', '-', '+', '=', '!', '?', '^', '~']
-            for _ in range(special_count):
-                generated_data.append(random.choice(special_chars))
+            generated_data += generate_numbers(num_count, -50, 50)
+            generated_data += generate_words(alpha_count, min_length, max_length)
+            generated_data += generate_specials(special_count)
                 
         elif data_type == 'numbers':
             # Generate only numbers
-            for _ in range(count):
-                num = random.randint(-100, 100)
-                generated_data.append(str(num))
+            generated_data = generate_numbers(count, -100, 100)
                 
         elif data_type == 'alphabets':
             # Generate only alphabets
-            for _ in range(count):
-                length = random.randint(min_length, max_length)
-                word = ''.join(random.choices(string.ascii_letters, k=length))
-                generated_data.append(word)
+            generated_data = generate_words(count, min_length, max_length)
                 
         elif data_type == 'special':
             # Generate only special characters
-            special_chars = ['@', '#', '$', '%', '&', '*', '-', '+', '=', '!', '?', '^', '~']
-            for _ in range(count):
-                generated_data.append(random.choice(special_chars))
+            generated_data = generate_specials(count)
                 
         elif data_type == 'pattern':
             # Generate pattern-based data
@@ -233,8 +617,7 @@ def generate_test_data():
                 elif i % 3 == 1:
                     generated_data.append(chr(97 + (i % 26)))  # a-z
                 else:
-                    special_chars = ['@', '#', '$', '%', '&']
-                    generated_data.append(special_chars[i % len(special_chars)])
+                    generated_data.append(_PATTERN_SPECIAL_CHARS[i % len(_PATTERN_SPECIAL_CHARS)])
         
         # Shuffle the generated data
         random.shuffle(generated_data)
@@ -261,5 +644,10 @@ def generate_test_data():
         }), 500
 
 if __name__ == '__main__':
+    # The built-in server is single-process; production runs under gunicorn
+    if os.environ.get('FLASK_DEV') != '1':
+        app.logger.warning("Use 'gunicorn -c gunicorn_conf.py app:app', or set FLASK_DEV=1 for the dev server")
+        sys.exit(1)
+    
     port = int(os.environ.get('PORT', 8000))
     app.run(host='0.0.0.0', port=port, debug=False)
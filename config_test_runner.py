@@ -5,8 +5,11 @@ Uses test_config.json to run predefined test scenarios
 """
 
 import requests
-import json
 import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any
 from pathlib import Path
 
@@ -15,17 +18,26 @@ class ConfigTestRunner:
         self.base_url = base_url
         self.config_file = config_file
         self.session = requests.Session()
+        
+        # Keep a larger pool of keep-alive connections for back-to-back scenario runs
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=0))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Content-Type': 'application/json'
+        })
+        
         self.config = self.load_config()
         
     def load_config(self) -> Dict[str, Any]:
         """Load test configuration from JSON file"""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return orjson.loads(Path(self.config_file).read_bytes())
         except FileNotFoundError:
             print(f"❌ Configuration file {self.config_file} not found")
             return {}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"❌ Error parsing configuration file: {e}")
             return {}
     
@@ -80,22 +92,29 @@ class ConfigTestRunner:
         print(f"📝 Description: {scenario_data.get('description', 'No description')}")
         print("-" * 60)
         
-        results = []
         tests = scenario_data.get('tests', [])
         
-        for test in tests:
+        # Tests are independent POSTs, so run them concurrently on the shared session
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [
+                executor.submit(
+                    self.run_single_test,
+                    test.get('data', []),
+                    test.get('expected', {}),
+                    test.get('name', 'Unnamed Test')
+                )
+                for test in tests
+            ]
+            results = [future.result() for future in futures]
+        
+        # Display results in order once all tests have finished
+        for test, test_result in zip(tests, results):
             test_name = test.get('name', 'Unnamed Test')
             test_data = test.get('data', [])
-            expected = test.get('expected', {})
             
             print(f"\n🧪 Test: {test_name}")
             print(f"📊 Input: {test_data[:10]}{'...' if len(test_data) > 10 else ''}")
             
-            # Run the test
-            test_result = self.run_single_test(test_data, expected, test_name)
-            results.append(test_result)
-            
-            # Display result
             if test_result["passed"]:
                 print(f"✅ PASSED - Response time: {test_result.get('response_time', 0):.3f}s")
             else:
@@ -110,10 +129,10 @@ class ConfigTestRunner:
     def run_single_test(self, test_data: List[str], expected: Dict[str, Any], test_name: str) -> Dict[str, Any]:
         """Run a single test case"""
         try:
-            payload = {"data": test_data}
+            payload = orjson.dumps({"data": test_data})
             
             start_time = time.time()
-            response = self.session.post(f"{self.base_url}/bfhl", json=payload)
+            response = self.session.post(f"{self.base_url}/bfhl", data=payload)
             end_time = time.time()
             
             result = {
@@ -269,12 +288,11 @@ def main():
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             results_file = f"test_results_{timestamp}.json"
             
-            with open(results_file, 'w') as f:
-                json.dump({
-                    "timestamp": timestamp,
-                    "summary": summary,
-                    "detailed_results": all_results
-                }, f, indent=2)
+            Path(results_file).write_bytes(orjson.dumps({
+                "timestamp": timestamp,
+                "summary": summary,
+                "detailed_results": all_results
+            }, option=orjson.OPT_INDENT_2))
             
             print(f"💾 Detailed results saved to: {results_file}")
         
@@ -46,5 +46,5 @@ echo ""
 echo "Press Ctrl+C to stop the server"
 echo "================================"
 
-# Start the Flask application
-python3 app.py
+# Start the application under gunicorn
+PORT=${PORT:-5000} gunicorn -c gunicorn_conf.py app:app
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-Time Build for the process_array Scan Kernel
+Compiles _scan_items into the process_array_mod extension imported by app.py
+"""
+
+from numba.pycc import CC
+
+from app import _scan_items
+
+cc = CC('process_array_mod')
+
+# scan(codes: int8[:], values: int64[:]) -> (sum, even_mask, odd_mask)
+cc.export('scan', 'Tuple((i8, b1[:], b1[:]))(i1[:], i8[:])')(_scan_items)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -6,33 +6,80 @@ Tests all the examples provided in the VIT question paper
 
 import requests
 import json
+import msgpack
+import orjson
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # API base URL (change this to your deployed URL)
 BASE_URL = "http://localhost:8000"
 
-def test_endpoint(endpoint, method="GET", data=None):
-    """Test an API endpoint"""
+# Pretty-print every response body, not just failures (BFHL_VERBOSE=1)
+VERBOSE = os.environ.get("BFHL_VERBOSE", "0") == "1"
+
+# Shared session so every test reuses pooled keep-alive connections
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.1))
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+_session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+
+# Endpoints that take and return msgpack instead of JSON
+MSGPACK_ENDPOINTS = frozenset({"/bfhl/bin"})
+
+def encode_body(endpoint, data):
+    """Return the request body and content type; bytes are sent as-is to test malformed bodies"""
+    content_type = "application/msgpack" if endpoint in MSGPACK_ENDPOINTS else "application/json"
+    if isinstance(data, bytes):
+        return data, content_type
+    if endpoint in MSGPACK_ENDPOINTS:
+        return msgpack.packb(data), content_type
+    return orjson.dumps(data), content_type
+
+def decode_body(response):
+    """Parse a JSON or msgpack response body"""
+    if response.headers.get("Content-Type", "").startswith("application/msgpack"):
+        return msgpack.unpackb(response.content, raw=False)
+    return orjson.loads(response.content)
+
+def send_request(endpoint, method="GET", data=None):
+    """Send one request to the API over the shared session"""
+    if method == "GET":
+        return _session.get(f"{BASE_URL}{endpoint}")
+    if method == "POST":
+        body, content_type = encode_body(endpoint, data)
+        return _session.post(
+            f"{BASE_URL}{endpoint}",
+            data=body,
+            headers={"Content-Type": content_type}
+        )
+    raise ValueError(f"Unsupported method: {method}")
+
+def report_endpoint(endpoint, method, data, get_response):
+    """Print the result of one endpoint test; get_response returns the response or raises"""
     try:
-        if method == "GET":
-            response = requests.get(f"{BASE_URL}{endpoint}")
-        elif method == "POST":
-            response = requests.post(f"{BASE_URL}{endpoint}", json=data)
-        else:
-            print(f"Unsupported method: {method}")
-            return False
+        response = get_response()
             
         print(f"\n{'='*60}")
         print(f"Testing {method} {endpoint}")
         print(f"{'='*60}")
         
-        if data:
+        if isinstance(data, bytes):
+            print(f"Request Data: {data!r}")
+        elif data:
             print(f"Request Data: {json.dumps(data, indent=2)}")
         
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        ok = response.status_code == 200
+        if not ok or VERBOSE:
+            print(f"Response: {json.dumps(decode_body(response), indent=2)}")
+        else:
+            print(f"Response: status=200 ({len(response.content)}B)")
         
-        return response.status_code == 200
+        return ok
         
     except requests.exceptions.ConnectionError:
         print(f"❌ Connection Error: Make sure the API is running at {BASE_URL}")
@@ -41,81 +88,86 @@ def test_endpoint(endpoint, method="GET", data=None):
         print(f"❌ Error: {str(e)}")
         return False
 
+def test_endpoint(endpoint, method="GET", data=None):
+    """Test an API endpoint"""
+    return report_endpoint(endpoint, method, data, lambda: send_request(endpoint, method, data))
+
+# (header, [(endpoint, method, data), ...]) groups; the requests are independent of each other
+EXAMPLE_GROUPS = [
+    ("🧪 Testing BFHL API with VIT Question Examples", [
+        # Health check and API info
+        ("/", "GET", None),
+        ("/bfhl", "GET", None),
+        # Examples A, B and C from the question paper
+        ("/bfhl", "POST", {"data": ["a", "1", "334", "4", "R", "$"]}),
+        ("/bfhl", "POST", {"data": ["2", "a", "y", "4", "&", "-", "*", "5", "92", "b"]}),
+        ("/bfhl", "POST", {"data": ["A", "ABcD", "DOE"]}),
+    ]),
+    ("\n🧪 Testing Additional Edge Cases", [
+        # Empty array
+        ("/bfhl", "POST", {"data": []}),
+        # Only numbers, only alphabets, only special characters
+        ("/bfhl", "POST", {"data": ["1", "2", "3", "4", "5"]}),
+        ("/bfhl", "POST", {"data": ["a", "B", "c", "D"]}),
+        ("/bfhl", "POST", {"data": ["@", "#", "$", "%"]}),
+        # Mixed with negative numbers
+        ("/bfhl", "POST", {"data": ["-1", "2", "a", "B", "&"]}),
+        # Example A through the msgpack endpoint
+        ("/bfhl/bin", "POST", {"data": ["a", "1", "334", "4", "R", "$"]}),
+        # Examples A and C in one batch, plus a sub-request that fails on its own
+        ("/batch", "POST", {"requests": [
+            {"id": "a", "method": "POST", "uri": "/bfhl", "parameters": {"data": ["a", "1", "334", "4", "R", "$"]}},
+            {"id": "c", "method": "POST", "uri": "/bfhl", "parameters": {"data": ["A", "ABcD", "DOE"]}},
+            {"id": "bad", "method": "POST", "uri": "/bfhl", "parameters": {"data": "not_an_array"}},
+        ]}),
+    ]),
+]
+
+ERROR_GROUPS = [
+    ("\n🧪 Testing Error Handling", [
+        # Missing data field
+        ("/bfhl", "POST", {}),
+        # Invalid data type (not array)
+        ("/bfhl", "POST", {"data": "not_an_array"}),
+        # The same checks on the msgpack endpoint, plus a body that is not msgpack
+        ("/bfhl/bin", "POST", {}),
+        ("/bfhl/bin", "POST", {"data": "not_an_array"}),
+        ("/bfhl/bin", "POST", b"\xc1"),
+        # Batch bodies that are not JSON, have no requests array or are over the size limit
+        ("/batch", "POST", b"not json"),
+        ("/batch", "POST", {"requests": "not_an_array"}),
+        ("/batch", "POST", {"requests": [{}] * 101}),
+        # Malformed JSON (this will be handled by Flask)
+    ]),
+]
+
+def run_test_groups(groups, max_workers=8):
+    """
+    Send every request in groups concurrently, then print the results in order
+    requests releases the GIL on socket I/O and the pooled session is shared by the workers
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [[executor.submit(send_request, *case) for case in cases] for _, cases in groups]
+        for (header, cases), group_futures in zip(groups, futures):
+            print(header)
+            for (endpoint, method, data), future in zip(cases, group_futures):
+                report_endpoint(endpoint, method, data, future.result)
+
 def test_examples():
     """Test all the examples from the question paper"""
-    print("🧪 Testing BFHL API with VIT Question Examples")
-    
-    # Test health check
-    test_endpoint("/")
-    
-    # Test API info
-    test_endpoint("/bfhl")
-    
-    # Example A from question paper
-    example_a = {
-        "data": ["a", "1", "334", "4", "R", "$"]
-    }
-    test_endpoint("/bfhl", "POST", example_a)
-    
-    # Example B from question paper
-    example_b = {
-        "data": ["2", "a", "y", "4", "&", "-", "*", "5", "92", "b"]
-    }
-    test_endpoint("/bfhl", "POST", example_b)
-    
-    # Example C from question paper
-    example_c = {
-        "data": ["A", "ABcD", "DOE"]
-    }
-    test_endpoint("/bfhl", "POST", example_c)
-    
-    # Additional test cases
-    print("\n🧪 Testing Additional Edge Cases")
-    
-    # Empty array
-    empty_array = {"data": []}
-    test_endpoint("/bfhl", "POST", empty_array)
-    
-    # Only numbers
-    numbers_only = {"data": ["1", "2", "3", "4", "5"]}
-    test_endpoint("/bfhl", "POST", numbers_only)
-    
-    # Only alphabets
-    alphabets_only = {"data": ["a", "B", "c", "D"]}
-    test_endpoint("/bfhl", "POST", alphabets_only)
-    
-    # Only special characters
-    special_only = {"data": ["@", "#", "$", "%"]}
-    test_endpoint("/bfhl", "POST", special_only)
-    
-    # Mixed with negative numbers
-    negative_numbers = {"data": ["-1", "2", "a", "B", "&"]}
-    test_endpoint("/bfhl", "POST", negative_numbers)
+    run_test_groups(EXAMPLE_GROUPS)
 
 def test_error_handling():
     """Test error handling scenarios"""
-    print("\n🧪 Testing Error Handling")
-    
-    # Missing data field
-    missing_data = {}
-    test_endpoint("/bfhl", "POST", missing_data)
-    
-    # Invalid data type (not array)
-    invalid_data = {"data": "not_an_array"}
-    test_endpoint("/bfhl", "POST", invalid_data)
-    
-    # Malformed JSON (this will be handled by Flask)
+    run_test_groups(ERROR_GROUPS)
 
 if __name__ == "__main__":
     print("🚀 BFHL API Test Suite")
     print("Make sure the API is running before executing tests")
     
     try:
-        # Test basic functionality
-        test_examples()
-        
-        # Test error handling
-        test_error_handling()
+        # Test basic functionality and error handling in one pool
+        run_test_groups(EXAMPLE_GROUPS + ERROR_GROUPS)
         
         print("\n✅ All tests completed!")
         